@@ -0,0 +1,91 @@
+"""Multithreaded ingestion stress benchmark.
+
+Runs concurrent writers through EmissionPublisher.collect while readers
+take full and per-agent snapshots via get_emissions, for increasing
+thread and shard counts, and prints write throughput and read counts.
+Shard counts are compared to show that readers never stall writers; under
+the GIL more shards do not raise write throughput.
+Usage: python -m benchmarks.ingest_stress [--emissions N] [--readers N]
+"""
+from __future__ import annotations
+import argparse
+import threading
+import time
+from pkg.emitter.publisher import EmissionPublisher
+from pkg.models.emission import Emission, EmissionType
+
+def run(
+    threads: int, shards: int, emissions: int, readers: int
+) -> tuple[float, int, int]:
+    """Return emissions collected per second and full/agent read counts."""
+    publisher = EmissionPublisher(shards=shards)
+    per_thread = emissions // threads
+    batches = [
+        [
+            Emission(
+                id=f"em-{t}-{i}",
+                emission_type=EmissionType.TOOL_INVOKED,
+                agent_id=f"agent-{t}-{i % 64}",
+                component_name="SearchTool",
+            )
+            for i in range(per_thread)
+        ]
+        for t in range(threads)
+    ]
+    done = threading.Event()
+    reads = {"full": 0, "agent": 0}
+
+    def write(batch):
+        for emission in batch:
+            publisher.collect(emission)
+
+    def read_full():
+        while not done.is_set():
+            publisher.get_emissions()
+            reads["full"] += 1
+
+    def read_agent():
+        while not done.is_set():
+            publisher.get_emissions(agent_id="agent-0-0")
+            reads["agent"] += 1
+
+    workers = [threading.Thread(target=write, args=(b,)) for b in batches]
+    reader_threads = [
+        threading.Thread(target=read_full if i % 2 == 0 else read_agent)
+        for i in range(readers)
+    ]
+    for thread in reader_threads:
+        thread.start()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+    assert len(publisher.get_emissions()) == per_thread * threads
+    return per_thread * threads / elapsed, reads["full"], reads["agent"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emissions", type=int, default=200_000)
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+    print(
+        f"{'threads':>7} {'shards':>6} {'emissions/s':>12} "
+        f"{'full reads':>10} {'agent reads':>11}"
+    )
+    for threads in (1, 2, 4, 8):
+        for shards in (1, 16):
+            rate, full, agent = run(
+                threads, shards, args.emissions, args.readers
+            )
+            print(
+                f"{threads:>7} {shards:>6} {rate:>12,.0f} "
+                f"{full:>10,} {agent:>11,}"
+            )
+
+if __name__ == "__main__":
+    main()
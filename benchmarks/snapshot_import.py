@@ -0,0 +1,88 @@
+"""Snapshot import benchmark.
+
+Exports emissions as JSON and as columnar snapshots, then times loading
+each into a fresh publisher: JSON via json.load, Emission(**row) and
+collect_batch, snapshots via import_snapshot. Both paths end up building
+the same pydantic models, which with the cyclic GC work they cause sets
+a floor that the snapshot formats cannot go below.
+Usage: python -m benchmarks.snapshot_import [--emissions N]
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+from pkg.emitter import snapshot
+from pkg.emitter.publisher import EmissionPublisher
+from pkg.models.emission import Emission, EmissionType
+
+def build(count: int) -> EmissionPublisher:
+    """Return a publisher holding count emissions across 500 agents."""
+    publisher = EmissionPublisher()
+    publisher.collect_batch([
+        Emission(
+            id=f"em-{i}",
+            emission_type=EmissionType.TOOL_INVOKED,
+            agent_id=f"agent-{i % 500}",
+            component_name="SearchTool",
+            component_version="1.0",
+            provider="Internal",
+            metadata={"episode_id": f"ep-{i % 50}"},
+        )
+        for i in range(count)
+    ])
+    return publisher
+
+def load_json(filepath: str) -> EmissionPublisher:
+    """Replay a JSON export into a fresh publisher."""
+    publisher = EmissionPublisher()
+    with open(filepath) as f:
+        data = json.load(f)
+    publisher.collect_batch([Emission(**row) for row in data["emissions"]])
+    return publisher
+
+def load_snapshot(filepath: str) -> EmissionPublisher:
+    """Import a snapshot into a fresh publisher."""
+    publisher = EmissionPublisher()
+    publisher.import_snapshot(filepath)
+    return publisher
+
+def timed(fn, filepath: str, count: int) -> float:
+    """Time one load, starting from a collected heap."""
+    gc.collect()
+    start = time.perf_counter()
+    publisher = fn(filepath)
+    elapsed = time.perf_counter() - start
+    assert len(publisher.get_emissions()) == count
+    return elapsed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emissions", type=int, default=100_000)
+    args = parser.parse_args()
+    source = build(args.emissions)
+    engines = ["binary"]
+    if snapshot.default_engine() == "arrow":
+        engines.append("arrow")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {"json": os.path.join(tmp, "emissions.json")}
+        source.export_json(paths["json"])
+        for engine in engines:
+            paths[engine] = os.path.join(tmp, f"emissions.{engine}")
+            source.export_snapshot(paths[engine], engine)
+        print(f"{'format':>7} {'size MB':>8} {'load s':>7} {'speedup':>8}")
+        baseline = timed(load_json, paths["json"], args.emissions)
+        for name, path in paths.items():
+            elapsed = baseline if name == "json" else timed(
+                load_snapshot, path, args.emissions
+            )
+            size = os.path.getsize(path) / 1e6
+            print(
+                f"{name:>7} {size:>8.1f} {elapsed:>7.2f} "
+                f"{baseline / elapsed:>7.1f}x"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,115 @@
-"""CLI commands for emissions."""
+"""CLI commands for emissions.
+
+httpx and rich are imported on first use so that cold start stays cheap
+for scripts that invoke the CLI in a loop.
+"""
+import atexit
+import shlex
 import click
-from rich.console import Console
-from rich.table import Table
-import httpx
-import json
 
-console = Console()
 BASE_URL = "http://localhost:8700/v1"
+_state = {}
+
+def _get_console():
+    """Return the shared rich console, importing rich on first use."""
+    console = _state.get("console")
+    if console is None:
+        from rich.console import Console
+        console = _state["console"] = Console()
+    return console
+
+def _get_client():
+    """Return the shared HTTP client, reusing its connection pool."""
+    client = _state.get("client")
+    if client is None:
+        import httpx
+        client = _state["client"] = httpx.Client()
+        atexit.register(client.close)
+    return client
+
+def _new_async_client(concurrency: int):
+    """Create an async HTTP client sized for the given concurrency."""
+    import httpx
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=concurrency)
+    )
+
+def _resolve_agents(agent_ids: tuple, agents_file) -> list[str]:
+    """Merge --agent-id values and --agents-file lines, keeping order."""
+    agents = list(agent_ids)
+    if agents_file is not None:
+        for line in agents_file:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                agents.append(line)
+    return list(dict.fromkeys(agents))
+
+def _fan_out(
+    agents: list[str], request, row, concurrency: int
+) -> list[tuple]:
+    """Run request(client, agent_id) for every agent over one AsyncClient.
+
+    At most ``concurrency`` requests are in flight. Each response body is
+    turned into table cells by row(data). Returns (agent_id, cells, error)
+    tuples in input order; error is set if the request or row failed.
+    """
+    import asyncio
+
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+        async with _new_async_client(concurrency) as client:
+            async def one(agent_id):
+                async with semaphore:
+                    try:
+                        resp = await request(client, agent_id)
+                        resp.raise_for_status()
+                        return agent_id, row(resp.json()), None
+                    except Exception as e:
+                        return agent_id, None, e
+            return await asyncio.gather(*(one(a) for a in agents))
+    return asyncio.run(run())
+
+def _print_fan_out(title: str, columns: list[str], results: list[tuple]):
+    """Print fan-out results as one table, exiting 1 if any agent failed."""
+    from rich.markup import escape
+    from rich.table import Table
+    console = _get_console()
+    table = Table(title=title)
+    table.add_column("Agent")
+    for column in columns:
+        table.add_column(column)
+    table.add_column("Status")
+    failed = 0
+    for agent_id, cells, error in results:
+        if error is None:
+            table.add_row(agent_id, *cells, "[green]✓[/green]")
+        else:
+            failed += 1
+            response = getattr(error, "response", None)
+            if response is not None:
+                reason = f"HTTP {response.status_code}"
+            else:
+                reason = str(error) or type(error).__name__
+            table.add_row(
+                agent_id, *[""] * len(columns), f"[red]{escape(reason)}[/red]"
+            )
+    console.print(table)
+    console.print(f"  {len(results) - failed} succeeded, {failed} failed")
+    if failed:
+        raise click.exceptions.Exit(1)
+
+agents_file_option = click.option(
+    "--agents-file",
+    type=click.File("r"),
+    default=None,
+    help="File with one agent ID per line",
+)
+concurrency_option = click.option(
+    "--concurrency",
+    default=16,
+    type=click.IntRange(min=1),
+    help="Max concurrent requests for multiple agents",
+)
 
 @click.group()
 def cli():
@@ -16,92 +119,210 @@ def cli():
 @cli.command()
 def health():
     """Check emitter health."""
+    console = _get_console()
     try:
-        with httpx.Client() as client:
-            resp = client.get(f"{BASE_URL}/health")
-            resp.raise_for_status()
-            data = resp.json()
-            console.print("[green]✓[/green] Emitter is healthy")
-            console.print(f"  Emissions collected: {data['emissions_collected']}")
+        resp = _get_client().get(f"{BASE_URL}/health")
+        resp.raise_for_status()
+        data = resp.json()
+        console.print("[green]✓[/green] Emitter is healthy")
+        console.print(f"  Emissions collected: {data['emissions_collected']}")
     except Exception as e:
         console.print(f"[red]✗[/red] Health check failed: {e}")
+        raise click.exceptions.Exit(1)
 
 @cli.command()
-@click.option("--agent-id", required=True, help="Agent ID")
+@click.option("--agent-id", "agent_ids", multiple=True, help="Agent ID (repeatable)")
+@agents_file_option
 @click.option("--limit", default=100, help="Episode limit")
-def observe(agent_id: str, limit: int):
+@concurrency_option
+def observe(agent_ids: tuple, agents_file, limit: int, concurrency: int):
     """Observe agent episodes."""
-    try:
-        with httpx.Client() as client:
-            resp = client.post(
+    agents = _resolve_agents(agent_ids, agents_file)
+    if not agents:
+        raise click.UsageError("Provide --agent-id or --agents-file")
+    if len(agents) > 1:
+        results = _fan_out(
+            agents,
+            lambda client, agent_id: client.post(
                 f"{BASE_URL}/observe",
                 params={"agent_id": agent_id, "limit": limit}
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            console.print(
-                f"[green]✓[/green] Observed {data['emissions_generated']} "
-                f"emissions from {agent_id}"
-            )
-            console.print(f"  Total collected: {data['total_collected']}")
+            ),
+            lambda data: [str(data["emissions_generated"])],
+            concurrency,
+        )
+        _print_fan_out(
+            f"Observed {len(agents)} agents",
+            ["Emissions"],
+            results,
+        )
+        return
+    agent_id = agents[0]
+    console = _get_console()
+    try:
+        resp = _get_client().post(
+            f"{BASE_URL}/observe",
+            params={"agent_id": agent_id, "limit": limit}
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        console.print(
+            f"[green]✓[/green] Observed {data['emissions_generated']} "
+            f"emissions from {agent_id}"
+        )
+        console.print(f"  Total collected: {data['total_collected']}")
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
+        raise click.exceptions.Exit(1)
 
 @cli.command()
-@click.option("--agent-id", required=True, help="Agent ID")
-def summary(agent_id: str):
+@click.option("--agent-id", "agent_ids", multiple=True, help="Agent ID (repeatable)")
+@agents_file_option
+@concurrency_option
+def summary(agent_ids: tuple, agents_file, concurrency: int):
     """Get agent emission summary."""
+    agents = _resolve_agents(agent_ids, agents_file)
+    if not agents:
+        raise click.UsageError("Provide --agent-id or --agents-file")
+    if len(agents) > 1:
+        results = _fan_out(
+            agents,
+            lambda client, agent_id: client.get(
+                f"{BASE_URL}/summary/{agent_id}"
+            ),
+            lambda data: [
+                str(data["total_emissions"]),
+                str(len(data["unique_models"])),
+                str(len(data["unique_tools"])),
+                str(len(data["unique_data_sources"])),
+            ],
+            concurrency,
+        )
+        _print_fan_out(
+            f"Emissions for {len(agents)} agents",
+            ["Total Emissions", "Models", "Tools", "Data Sources"],
+            results,
+        )
+        return
+    agent_id = agents[0]
+    console = _get_console()
     try:
-        with httpx.Client() as client:
-            resp = client.get(f"{BASE_URL}/summary/{agent_id}")
-            resp.raise_for_status()
-            data = resp.json()
-            table = Table(title=f"Emissions for {agent_id}")
-            table.add_column("Metric")
-            table.add_column("Value")
-            table.add_row("Total Emissions", str(data["total_emissions"]))
-            table.add_row("Unique Models", str(len(data["unique_models"])))
-            table.add_row("Unique Tools", str(len(data["unique_tools"])))
-            table.add_row("Unique Data Sources", str(len(data["unique_data_sources"])))
-            console.print(table)
+        from rich.table import Table
+        resp = _get_client().get(f"{BASE_URL}/summary/{agent_id}")
+        resp.raise_for_status()
+        data = resp.json()
+        table = Table(title=f"Emissions for {agent_id}")
+        table.add_column("Metric")
+        table.add_column("Value")
+        table.add_row("Total Emissions", str(data["total_emissions"]))
+        table.add_row("Unique Models", str(len(data["unique_models"])))
+        table.add_row("Unique Tools", str(len(data["unique_tools"])))
+        table.add_row("Unique Data Sources", str(len(data["unique_data_sources"])))
+        console.print(table)
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
+        raise click.exceptions.Exit(1)
 
 @cli.command()
 @click.option("--agent-id", default=None, help="Filter by agent")
 @click.option("--type", "emission_type", default=None, help="Filter by type")
 def list_emissions(agent_id: str, emission_type: str):
     """List collected emissions."""
+    console = _get_console()
     try:
         params = {}
         if agent_id:
             params["agent_id"] = agent_id
         if emission_type:
             params["emission_type"] = emission_type
-        with httpx.Client() as client:
-            resp = client.get(f"{BASE_URL}/emissions", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            console.print(f"Found {data['count']} emissions")
+        resp = _get_client().get(f"{BASE_URL}/emissions", params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        console.print(f"Found {data['count']} emissions")
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
+        raise click.exceptions.Exit(1)
 
 @cli.command()
 @click.option("--aibom-id", required=True, help="AIBOM ID")
-@click.option("--agent-id", default=None, help="Filter by agent")
-def publish(aibom_id: str, agent_id: str):
+@click.option("--agent-id", "agent_ids", multiple=True, help="Filter by agent (repeatable)")
+@agents_file_option
+@concurrency_option
+def publish(aibom_id: str, agent_ids: tuple, agents_file, concurrency: int):
     """Publish emissions to AIBOM."""
+    agents = _resolve_agents(agent_ids, agents_file)
+    if agents_file is not None and not agents:
+        raise click.UsageError("--agents-file lists no agent IDs")
+    if len(agents) > 1:
+        results = _fan_out(
+            agents,
+            lambda client, agent_id: client.post(
+                f"{BASE_URL}/publish",
+                params={"aibom_id": aibom_id, "agent_id": agent_id}
+            ),
+            lambda data: [str(data["count"])],
+            concurrency,
+        )
+        _print_fan_out(
+            f"Published to {aibom_id}",
+            ["Components"],
+            results,
+        )
+        return
+    agent_id = agents[0] if agents else None
+    console = _get_console()
     try:
         params = {"aibom_id": aibom_id}
         if agent_id:
             params["agent_id"] = agent_id
-        with httpx.Client() as client:
-            resp = client.post(f"{BASE_URL}/publish", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            console.print(f"[green]✓[/green] Published {data['count']} components")
+        resp = _get_client().post(f"{BASE_URL}/publish", params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        console.print(f"[green]✓[/green] Published {data['count']} components")
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
+        raise click.exceptions.Exit(1)
+
+@cli.command()
+@click.argument("commands", type=click.File("r"), default="-")
+def batch(commands):
+    """Run one command per line in a single process.
+
+    Lines are split like a shell command line; blank lines and lines
+    starting with # are skipped. All commands share one HTTP connection.
+    Exits with status 1 if any line failed.
+    """
+    failed = []
+    for lineno, line in enumerate(commands, start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            click.echo(f"Error: line {lineno}: {e}", err=True)
+            failed.append(lineno)
+            continue
+        if not args:
+            continue
+        if args[0] == "batch":
+            click.echo(
+                f"Error: line {lineno}: batch cannot be nested", err=True
+            )
+            failed.append(lineno)
+            continue
+        try:
+            status = cli.main(
+                args=args, prog_name="cli", standalone_mode=False
+            )
+        except click.ClickException as e:
+            e.show()
+            status = e.exit_code
+        if status:
+            failed.append(lineno)
+    if failed:
+        lines = ", ".join(str(lineno) for lineno in failed)
+        click.echo(
+            f"Error: {len(failed)} command(s) failed (lines {lines})",
+            err=True,
+        )
+        raise click.exceptions.Exit(1)
 
 if __name__ == "__main__":
     cli()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from pkg.models.emission import Emission, EmissionType, EmissionSummary
+from pkg.models.component import ComponentAgents
 from pkg.collector.observer import RuntimeObserver
 from pkg.emitter.publisher import EmissionPublisher
 
@@ -89,11 +90,67 @@ async def publish_to_aibom(aibom_id: str, agent_id: str | None = None):
     return result
 
 @router.post("/v1/export")
-async def export_emissions(filepath: str = "/tmp/emissions.json"):
-    """Export emissions to JSON file."""
-    publisher.export_json(filepath)
+async def export_emissions(
+    filepath: str = "/tmp/emissions.json",
+    format: str = "json"
+):
+    """Export emissions to a JSON file or columnar snapshot."""
+    if format == "json":
+        publisher.export_json(filepath)
+    elif format in ("snapshot", "arrow", "binary"):
+        engine = None if format == "snapshot" else format
+        try:
+            publisher.export_snapshot(filepath, engine)
+        except RuntimeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid export format: {format}"
+        )
     return {
         "exported": True,
         "filepath": filepath,
+        "format": format,
         "count": len(publisher._emissions)
     }
+
+@router.post("/v1/import")
+async def import_emissions(filepath: str):
+    """Import emissions from a columnar snapshot."""
+    try:
+        count = publisher.import_snapshot(filepath)
+    except (OSError, ValueError, RuntimeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "imported": count,
+        "filepath": filepath,
+        "total_collected": len(publisher._emissions)
+    }
+
+@router.get("/v1/components")
+async def list_components(component_type: str | None = None):
+    """List catalogued components across all agents."""
+    components = publisher.catalog.components(component_type)
+    return {
+        "count": len(components),
+        "components": components
+    }
+
+@router.get("/v1/components/{name}/agents")
+async def get_component_agents(
+    name: str,
+    component_type: str | None = None,
+    version: str | None = None,
+    provider: str | None = None
+) -> ComponentAgents:
+    """Get agents that used a component."""
+    result = publisher.catalog.agents_for(
+        name, component_type, version, provider
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown component: {name}"
+        )
+    return result
@@ -0,0 +1,4 @@
+"""Catalog package."""
+from .catalog import ComponentCatalog
+
+__all__ = ["ComponentCatalog"]
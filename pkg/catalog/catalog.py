@@ -0,0 +1,145 @@
+"""Global component catalog with a cross-agent inverted index."""
+from __future__ import annotations
+import threading
+from typing import Iterable
+from pkg.models.emission import Emission
+from pkg.models.component import (
+    ComponentUsage,
+    ComponentAgentUsage,
+    ComponentAgents,
+)
+
+ComponentKey = tuple[str, str, str, str]
+
+class _Shard:
+    """Usage counters for the agents hashed to one shard."""
+    __slots__ = ("lock", "agents", "by_name")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.agents: dict[ComponentKey, dict[str, int]] = {}
+        self.by_name: dict[str, set[ComponentKey]] = {}
+
+    def add(self, key: ComponentKey, agent_id: str, count: int) -> None:
+        """Add uses of a component by one agent; caller holds the lock."""
+        agents = self.agents.get(key)
+        if agents is None:
+            agents = self.agents[key] = {}
+            self.by_name.setdefault(key[1], set()).add(key)
+        agents[agent_id] = agents.get(agent_id, 0) + count
+
+class ComponentCatalog:
+    """Indexes components by (type, name, version, provider) to agent ids.
+
+    Counters are sharded by agent_id hash, like ShardedEmissionStore, so
+    writers for agents in different shards take different locks. Each
+    agent lives in exactly one shard, so reads merge shards by summing.
+    """
+    def __init__(self, shards: int = 16) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def _shard(self, agent_id: str) -> _Shard:
+        return self._shards[hash(agent_id) % len(self._shards)]
+
+    def record(self, component_type: str, emission: Emission) -> None:
+        """Record one use of a component by the emitting agent."""
+        key = (
+            component_type,
+            emission.component_name,
+            emission.component_version,
+            emission.provider,
+        )
+        shard = self._shard(emission.agent_id)
+        with shard.lock:
+            shard.add(key, emission.agent_id, 1)
+
+    def record_many(self, records: Iterable[tuple[str, Emission]]) -> None:
+        """Record (component_type, emission) uses, locking each shard once."""
+        counts: dict[tuple[ComponentKey, str], int] = {}
+        for component_type, emission in records:
+            entry = (
+                (
+                    component_type,
+                    emission.component_name,
+                    emission.component_version,
+                    emission.provider,
+                ),
+                emission.agent_id,
+            )
+            counts[entry] = counts.get(entry, 0) + 1
+        by_shard: dict[int, list[tuple[ComponentKey, str, int]]] = {}
+        for (key, agent_id), count in counts.items():
+            index = hash(agent_id) % len(self._shards)
+            by_shard.setdefault(index, []).append((key, agent_id, count))
+        for index, entries in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key, agent_id, count in entries:
+                    shard.add(key, agent_id, count)
+
+    def components(
+        self,
+        component_type: str | None = None
+    ) -> list[ComponentUsage]:
+        """List catalogued components with optional type filtering."""
+        totals: dict[ComponentKey, list[int]] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for key, agents in shard.agents.items():
+                    if component_type is not None and key[0] != component_type:
+                        continue
+                    total = totals.setdefault(key, [0, 0])
+                    total[0] += len(agents)
+                    total[1] += sum(agents.values())
+        return [
+            ComponentUsage(
+                component_type=key[0],
+                name=key[1],
+                version=key[2],
+                provider=key[3],
+                agent_count=agent_count,
+                usage_count=usage_count,
+            )
+            for key, (agent_count, usage_count) in totals.items()
+        ]
+
+    def agents_for(
+        self,
+        name: str,
+        component_type: str | None = None,
+        version: str | None = None,
+        provider: str | None = None
+    ) -> ComponentAgents | None:
+        """Get agents that used a component, or None if no entry matches."""
+        counts: dict[str, int] = {}
+        matched = False
+        for shard in self._shards:
+            with shard.lock:
+                for key in shard.by_name.get(name, ()):
+                    if component_type is not None and key[0] != component_type:
+                        continue
+                    if version is not None and key[2] != version:
+                        continue
+                    if provider is not None and key[3] != provider:
+                        continue
+                    matched = True
+                    for agent_id, count in shard.agents[key].items():
+                        counts[agent_id] = counts.get(agent_id, 0) + count
+        if not matched:
+            return None
+        return ComponentAgents(
+            name=name,
+            agents=[
+                ComponentAgentUsage(agent_id=agent_id, usage_count=count)
+                for agent_id, count in sorted(counts.items())
+            ],
+        )
+
+    def __len__(self) -> int:
+        keys: set[ComponentKey] = set()
+        for shard in self._shards:
+            with shard.lock:
+                keys.update(shard.agents)
+        return len(keys)
@@ -1,15 +1,18 @@
 """Runtime observer for episode streams."""
 from __future__ import annotations
+import threading
 import uuid
 from typing import Any
 from pkg.models.emission import Emission, EmissionType, EmissionSummary
+from pkg.store.sharded import ShardedEmissionStore
 
 class RuntimeObserver:
     """Observes episode execution and generates emissions."""
     def __init__(self, episode_store_url: str = "http://localhost:8000") -> None:
         self.episode_store_url = episode_store_url
-        self._emissions: list[Emission] = []
+        self._emissions = ShardedEmissionStore()
         self._observed_episodes: set[str] = set()
+        self._observed_lock = threading.Lock()
 
     async def observe_episodes(
         self,
@@ -36,9 +39,10 @@ class RuntimeObserver:
         if index >= 5:
             return None
         episode_id = f"ep-{agent_id}-{index}"
-        if episode_id in self._observed_episodes:
-            return None
-        self._observed_episodes.add(episode_id)
+        with self._observed_lock:
+            if episode_id in self._observed_episodes:
+                return None
+            self._observed_episodes.add(episode_id)
         return {
             "episode_id": episode_id,
             "agent_id": agent_id,
@@ -98,9 +102,7 @@ class RuntimeObserver:
 
     def get_summary(self, agent_id: str) -> EmissionSummary:
         """Get emission summary for agent."""
-        agent_emissions = [
-            e for e in self._emissions if e.agent_id == agent_id
-        ]
+        agent_emissions = self._emissions.snapshot(agent_id)
         unique_models = set()
         unique_tools = set()
         unique_data = set()
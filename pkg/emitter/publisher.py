@@ -1,23 +1,46 @@
 """Emission publisher for AIBOM integration."""
 from __future__ import annotations
 import json
+import threading
 from typing import Any
 from pkg.models.emission import Emission, EmissionType
+from pkg.catalog.catalog import ComponentCatalog
+from pkg.emitter.snapshot import read_snapshot, write_snapshot
+from pkg.store.sharded import ShardedEmissionStore
+
+_COMPONENT_TYPES = {
+    EmissionType.MODEL_USED: "model",
+    EmissionType.TOOL_INVOKED: "tool",
+    EmissionType.DATA_ACCESSED: "data_source",
+    EmissionType.POLICY_APPLIED: "policy",
+}
 
 class EmissionPublisher:
     """Publishes emissions to AIBOM engine."""
-    def __init__(self, aibom_api_url: str = "http://localhost:8600/v1") -> None:
+    def __init__(
+        self,
+        aibom_api_url: str = "http://localhost:8600/v1",
+        shards: int = 16
+    ) -> None:
         self.aibom_api_url = aibom_api_url
-        self._emissions: list[Emission] = []
+        self._emissions = ShardedEmissionStore(shards)
         self._published: set[str] = set()
+        self._published_lock = threading.Lock()
+        self.catalog = ComponentCatalog(shards)
 
     def collect(self, emission: Emission) -> None:
         """Collect an emission."""
         self._emissions.append(emission)
+        self.catalog.record(
+            self._map_emission_type(emission.emission_type), emission
+        )
 
     def collect_batch(self, emissions: list[Emission]) -> None:
         """Collect multiple emissions."""
         self._emissions.extend(emissions)
+        self.catalog.record_many(
+            (self._map_emission_type(e.emission_type), e) for e in emissions
+        )
 
     async def publish(
         self,
@@ -25,25 +48,23 @@ class EmissionPublisher:
         agent_id: str | None = None
     ) -> dict[str, Any]:
         """Publish emissions to AIBOM engine."""
-        target_emissions = self._emissions
-        if agent_id:
-            target_emissions = [
-                e for e in self._emissions if e.agent_id == agent_id
-            ]
+        target_emissions = self._emissions.snapshot(agent_id or None)
         published_count = 0
         for emission in target_emissions:
-            if emission.id not in self._published:
-                component_type = self._map_emission_type(emission.emission_type)
-                payload = {
-                    "aibom_id": aibom_id,
-                    "name": emission.component_name,
-                    "component_type": component_type,
-                    "provider": emission.provider,
-                    "version": emission.component_version,
-                    "description": f"Emitted from {emission.agent_id}",
-                }
+            with self._published_lock:
+                if emission.id in self._published:
+                    continue
                 self._published.add(emission.id)
-                published_count += 1
+            component_type = self._map_emission_type(emission.emission_type)
+            payload = {
+                "aibom_id": aibom_id,
+                "name": emission.component_name,
+                "component_type": component_type,
+                "provider": emission.provider,
+                "version": emission.component_version,
+                "description": f"Emitted from {emission.agent_id}",
+            }
+            published_count += 1
         return {
             "published": True,
             "count": published_count,
@@ -52,22 +73,54 @@ class EmissionPublisher:
 
     def export_json(self, filepath: str) -> None:
         """Export emissions to JSON file."""
+        emissions = self._emissions.snapshot()
         data = {
-            "emissions": [e.dict() for e in self._emissions],
-            "count": len(self._emissions),
+            "emissions": [e.dict() for e in emissions],
+            "count": len(emissions),
         }
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2, default=str)
 
+    def export_snapshot(self, filepath: str, engine: str | None = None) -> None:
+        """Export emissions to a columnar snapshot file."""
+        write_snapshot(self._emissions.snapshot(), filepath, engine)
+
+    def import_snapshot(self, filepath: str) -> int:
+        """Load emissions from a snapshot file and return the count.
+
+        Emissions the agent already has, matched by id or, for emissions
+        without an id, by their recorded fields, are skipped. The check
+        runs in the store under its shard locks, so concurrent imports
+        of the same file add each emission once.
+        """
+        emissions = self._emissions.extend_unique(
+            read_snapshot(filepath), self._identity
+        )
+        self.catalog.record_many(
+            (self._map_emission_type(e.emission_type), e) for e in emissions
+        )
+        return len(emissions)
+
+    @staticmethod
+    def _identity(emission: Emission) -> tuple:
+        """Key used to recognise an emission the agent already has."""
+        if emission.id:
+            return (emission.id,)
+        return (
+            emission.emission_type,
+            emission.component_name,
+            emission.component_version,
+            emission.provider,
+            emission.timestamp,
+        )
+
     def get_emissions(
         self,
         agent_id: str | None = None,
         emission_type: EmissionType | None = None
     ) -> list[Emission]:
         """Get collected emissions with optional filtering."""
-        result = self._emissions
-        if agent_id:
-            result = [e for e in result if e.agent_id == agent_id]
+        result = self._emissions.snapshot(agent_id or None)
         if emission_type:
             result = [e for e in result if e.emission_type == emission_type]
         return result
@@ -75,10 +128,4 @@ class EmissionPublisher:
     @staticmethod
     def _map_emission_type(emission_type: EmissionType) -> str:
         """Map emission type to component type."""
-        mapping = {
-            EmissionType.MODEL_USED: "model",
-            EmissionType.TOOL_INVOKED: "tool",
-            EmissionType.DATA_ACCESSED: "data_source",
-            EmissionType.POLICY_APPLIED: "policy",
-        }
-        return mapping.get(emission_type, "tool")
+        return _COMPONENT_TYPES.get(emission_type, "tool")
@@ -0,0 +1,348 @@
+"""Columnar snapshot export/import for emissions.
+
+pyarrow is optional and imported on first use, so that loading this
+module does not slow down server start-up.
+"""
+from __future__ import annotations
+import functools
+import json
+import mmap
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from typing import Any
+from pydantic import TypeAdapter
+from pkg.models.emission import Emission, EmissionType
+
+ARROW_MAGIC = b"ARROW1"
+BINARY_MAGIC = b"AIBOMSN1"
+_HEADER = struct.Struct("<II")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_STRING_COLUMNS = (
+    "id",
+    "emission_type",
+    "agent_id",
+    "component_name",
+    "component_version",
+    "provider",
+    "metadata",
+    "fields_set",
+    "utc_offset",
+)
+
+def _pyarrow():
+    """Import pyarrow on first use, returning None when not installed."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        return None
+    return pyarrow
+
+def default_engine() -> str:
+    """Return the best snapshot engine available."""
+    return "arrow" if _pyarrow() is not None else "binary"
+
+def write_snapshot(
+    emissions: list[Emission],
+    filepath: str,
+    engine: str | None = None
+) -> None:
+    """Write emissions to a columnar snapshot file."""
+    engine = engine or default_engine()
+    columns = _to_columns(emissions)
+    if engine == "arrow":
+        pa = _pyarrow()
+        if pa is None:
+            raise RuntimeError("pyarrow is required for the arrow engine")
+        _write_arrow(pa, columns, filepath)
+    elif engine == "binary":
+        _write_binary(columns, filepath)
+    else:
+        raise ValueError(f"Unknown snapshot engine: {engine}")
+
+def read_snapshot(filepath: str) -> list[Emission]:
+    """Read emissions from a snapshot file written by write_snapshot."""
+    with open(filepath, "rb") as f:
+        magic = f.read(len(BINARY_MAGIC))
+        if magic == BINARY_MAGIC:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                columns = _read_binary(mm)
+            if columns is None:
+                raise ValueError(f"Not an emission snapshot: {filepath}")
+            return _decode(columns, filepath)
+    if not magic.startswith(ARROW_MAGIC):
+        raise ValueError(f"Not an emission snapshot: {filepath}")
+    pa = _pyarrow()
+    if pa is None:
+        raise RuntimeError("pyarrow is required to read arrow snapshots")
+    try:
+        columns = _read_arrow(pa, filepath)
+    except pa.ArrowException:
+        columns = None
+    if columns is None:
+        raise ValueError(f"Not an emission snapshot: {filepath}")
+    return _decode(columns, filepath)
+
+def _decode(columns: dict[str, list], filepath: str) -> list[Emission]:
+    """Build emissions, reporting bad values as a non-snapshot file."""
+    try:
+        return _from_columns(columns)
+    except (KeyError, OverflowError, ValueError) as e:
+        raise ValueError(f"Not an emission snapshot: {filepath}") from e
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a timestamp to microseconds since the UTC epoch."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+def _utc_offset(timestamp: datetime) -> str:
+    """Encode a timestamp's UTC offset in seconds, empty when naive."""
+    offset = timestamp.utcoffset()
+    if offset is None:
+        return ""
+    return str(int(offset.total_seconds()))
+
+def _to_columns(emissions: list[Emission]) -> dict[str, list]:
+    """Pivot emissions into per-field columns."""
+    return {
+        "id": [e.id for e in emissions],
+        "emission_type": [e.emission_type.value for e in emissions],
+        "agent_id": [e.agent_id for e in emissions],
+        "component_name": [e.component_name for e in emissions],
+        "component_version": [e.component_version for e in emissions],
+        "provider": [e.provider for e in emissions],
+        "metadata": [
+            json.dumps(e.metadata, default=str, sort_keys=True)
+            for e in emissions
+        ],
+        "fields_set": [
+            ",".join(sorted(e.model_fields_set)) for e in emissions
+        ],
+        "utc_offset": [_utc_offset(e.timestamp) for e in emissions],
+        "timestamp": [_to_micros(e.timestamp) for e in emissions],
+    }
+
+@functools.cache
+def _rows_adapter() -> TypeAdapter:
+    """Validator that builds a whole list of emissions in pydantic-core."""
+    return TypeAdapter(list[Emission])
+
+@functools.cache
+def _fields_set_is_live() -> bool:
+    """Whether model_fields_set returns the instance's own set."""
+    probe = Emission.model_construct(_fields_set={"id"})
+    probe.model_fields_set.discard("id")
+    return not probe.model_fields_set
+
+def _is_flat(value: Any) -> bool:
+    """Whether a decoded metadata dict holds only immutable scalars."""
+    return all(
+        v is None or isinstance(v, (str, int, float, bool))
+        for v in value.values()
+    )
+
+def _from_columns(columns: dict[str, list]) -> list[Emission]:
+    """Build emissions from per-field columns.
+
+    All per-row work runs column by column in C loops: distinct
+    metadata strings are parsed once, rows are zipped into dicts with
+    every field present and the whole list is validated by pydantic-core
+    in one call. model_fields_set is then cut back to the fields that
+    were set on the exported emission.
+    """
+    fields = Emission.model_fields
+    if not set(columns["emission_type"]) <= {t.value for t in EmissionType}:
+        raise ValueError("Unknown emission type")
+    unset: dict[str, set[str]] = {}
+    for fields_set in set(columns["fields_set"]):
+        names = set(fields_set.split(",") if fields_set else ())
+        if not names <= fields.keys():
+            unknown = sorted(names - fields.keys())
+            raise ValueError(f"Unknown fields: {unknown}")
+        unset[fields_set] = fields.keys() - names
+    parsed = {value: json.loads(value) for value in set(columns["metadata"])}
+    if all(_is_flat(value) for value in parsed.values()):
+        # The validator copies each dict, so flat ones can be shared.
+        metadata = list(map(parsed.__getitem__, columns["metadata"]))
+    else:
+        metadata = list(map(json.loads, columns["metadata"]))
+    timestamps = [
+        _EPOCH + timedelta(0, 0, micros) for micros in columns["timestamp"]
+    ]
+    offsets = {
+        value: timezone(timedelta(seconds=int(value))) if value else None
+        for value in set(columns["utc_offset"]) - {"0"}
+    }
+    if offsets:
+        timestamps = [
+            timestamp if value == "0"
+            else timestamp.replace(tzinfo=None) if offsets[value] is None
+            else timestamp.astimezone(offsets[value])
+            for timestamp, value in zip(timestamps, columns["utc_offset"])
+        ]
+    keys = (
+        "id", "emission_type", "agent_id", "timestamp",
+        "component_name", "component_version", "provider", "metadata",
+    )
+    rows = map(dict, map(zip, repeat(keys), zip(
+        columns["id"],
+        columns["emission_type"],
+        columns["agent_id"],
+        timestamps,
+        columns["component_name"],
+        columns["component_version"],
+        columns["provider"],
+        metadata,
+    )))
+    emissions = _rows_adapter().validate_python(rows)
+    live = _fields_set_is_live()
+    for index, fields_set in enumerate(columns["fields_set"]):
+        extra = unset[fields_set]
+        if not extra:
+            continue
+        emission = emissions[index]
+        if live:
+            emission.model_fields_set.difference_update(extra)
+        else:
+            emissions[index] = Emission.model_construct(
+                _fields_set=emission.model_fields_set - extra,
+                **dict(emission),
+            )
+    return emissions
+
+def _write_arrow(pa, columns: dict[str, list], filepath: str) -> None:
+    """Write columns as an uncompressed Arrow IPC file."""
+    arrays = [
+        pa.array(columns[name], type=pa.string()).dictionary_encode()
+        for name in _STRING_COLUMNS
+    ]
+    arrays.append(pa.array(
+        columns["timestamp"], type=pa.timestamp("us", tz="UTC")
+    ))
+    table = pa.Table.from_arrays(
+        arrays, names=[*_STRING_COLUMNS, "timestamp"]
+    )
+    with pa.OSFile(filepath, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def _read_arrow(pa, filepath: str) -> dict[str, list] | None:
+    """Read columns from a memory-mapped Arrow IPC file.
+
+    Returns None when the file does not have the emission schema.
+    """
+    with pa.memory_map(filepath, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+        schema = table.schema
+        for name in _STRING_COLUMNS:
+            index = schema.get_field_index(name)
+            if index < 0:
+                return None
+            field_type = schema.field(index).type
+            if not (pa.types.is_dictionary(field_type)
+                    and pa.types.is_string(field_type.value_type)):
+                return None
+        index = schema.get_field_index("timestamp")
+        if index < 0 or not pa.types.is_timestamp(schema.field(index).type):
+            return None
+        if any(column.null_count for column in table.columns):
+            return None
+        columns = {
+            name: _decode_dictionary(table.column(name))
+            for name in _STRING_COLUMNS
+        }
+        columns["timestamp"] = (
+            table.column("timestamp").cast(pa.int64()).to_pylist()
+        )
+    return columns
+
+def _decode_dictionary(column) -> list[str]:
+    """Decode a dictionary-encoded Arrow column via its dictionary."""
+    values = []
+    for chunk in column.chunks:
+        dictionary = chunk.dictionary.to_pylist()
+        values.extend([dictionary[i] for i in chunk.indices.to_pylist()])
+    return values
+
+def _write_binary(columns: dict[str, list], filepath: str) -> None:
+    """Write columns in the built-in dictionary-encoded binary format.
+
+    Layout: magic, row and dictionary counts, dictionary offsets, the
+    UTF-8 dictionary blob, one uint32 index column per string field and
+    an int64 microsecond timestamp column, all little-endian.
+    """
+    dictionary: dict[str, int] = {}
+    indices = []
+    for name in _STRING_COLUMNS:
+        column = array("I", [
+            dictionary.setdefault(value, len(dictionary))
+            for value in columns[name]
+        ])
+        indices.append(column)
+    blob = bytearray()
+    offsets = array("I", [0])
+    for value in dictionary:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    timestamps = array("q", columns["timestamp"])
+    chunks = [offsets, *indices, timestamps]
+    if sys.byteorder != "little":
+        for chunk in chunks:
+            chunk.byteswap()
+    with open(filepath, "wb") as f:
+        f.write(BINARY_MAGIC)
+        f.write(_HEADER.pack(len(columns["id"]), len(dictionary)))
+        f.write(offsets.tobytes())
+        f.write(blob)
+        for chunk in chunks[1:]:
+            f.write(chunk.tobytes())
+
+def _read_binary(mm: mmap.mmap) -> dict[str, list] | None:
+    """Read columns from a memory-mapped binary snapshot.
+
+    Returns None when sizes or dictionary indices do not add up.
+    """
+    pos = len(BINARY_MAGIC)
+    if len(mm) < pos + _HEADER.size:
+        return None
+    count, size = _HEADER.unpack_from(mm, pos)
+    pos += _HEADER.size
+    if len(mm) < pos + 4 * (size + 1):
+        return None
+    offsets = _read_array(mm, "I", pos, size + 1)
+    pos += 4 * (size + 1)
+    expected = pos + offsets[-1] + (4 * len(_STRING_COLUMNS) + 8) * count
+    if len(mm) != expected or any(
+        offsets[i] > offsets[i + 1] for i in range(size)
+    ):
+        return None
+    blob = mm[pos:pos + offsets[-1]]
+    pos += offsets[-1]
+    try:
+        dictionary = [
+            blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+            for i in range(size)
+        ]
+        columns = {}
+        for name in _STRING_COLUMNS:
+            columns[name] = [
+                dictionary[i] for i in _read_array(mm, "I", pos, count)
+            ]
+            pos += 4 * count
+    except (IndexError, UnicodeDecodeError):
+        return None
+    columns["timestamp"] = _read_array(mm, "q", pos, count)
+    return columns
+
+def _read_array(mm: mmap.mmap, typecode: str, pos: int, count: int) -> list:
+    """Read a little-endian numeric array from the mapped file."""
+    values = array(typecode)
+    values.frombytes(mm[pos:pos + values.itemsize * count])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
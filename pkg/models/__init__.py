@@ -1,4 +1,12 @@
 """Models package."""
 from .emission import EmissionType, Emission, EmissionSummary
+from .component import ComponentUsage, ComponentAgentUsage, ComponentAgents
 
-__all__ = ["EmissionType", "Emission", "EmissionSummary"]
+__all__ = [
+    "EmissionType",
+    "Emission",
+    "EmissionSummary",
+    "ComponentUsage",
+    "ComponentAgentUsage",
+    "ComponentAgents",
+]
@@ -0,0 +1,22 @@
+"""Component catalog models."""
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+class ComponentUsage(BaseModel):
+    """Catalog entry for a component seen across agents."""
+    component_type: str
+    name: str
+    version: str = ""
+    provider: str = ""
+    agent_count: int = 0
+    usage_count: int = 0
+
+class ComponentAgentUsage(BaseModel):
+    """Usage of a component by a single agent."""
+    agent_id: str
+    usage_count: int = 0
+
+class ComponentAgents(BaseModel):
+    """Agents that used a named component."""
+    name: str
+    agents: list[ComponentAgentUsage] = Field(default_factory=list)
@@ -0,0 +1,4 @@
+"""Store package."""
+from .sharded import ShardedEmissionStore
+
+__all__ = ["ShardedEmissionStore"]
@@ -0,0 +1,131 @@
+"""Sharded, thread-safe emission store."""
+from __future__ import annotations
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Hashable, Iterable, Iterator
+from pkg.models.emission import Emission
+
+class _Shard:
+    """Per-agent append-only lists guarded by one lock."""
+    __slots__ = ("lock", "by_agent")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.by_agent: dict[str, list[Emission]] = {}
+
+class ShardedEmissionStore:
+    """Stores emissions in an append-only log with per-agent shards.
+
+    Every emission goes to one global log, in insertion order, and to its
+    agent's list in the shard picked by agent_id hash. All lists are only
+    ever appended to. A reader therefore only needs a length to get a
+    consistent snapshot: full snapshots copy a prefix of the log without
+    any lock, and per-agent snapshots hold their shard lock just long
+    enough to read the agent list's length, copying after releasing it.
+
+    Sharding keeps writers for different agents off each other's locks,
+    but under the GIL it gives no measurable write throughput gain:
+    benchmarks.ingest_stress shows 1 and 16 shards within noise of each
+    other. What it buys is safe concurrent access and cheap reads.
+    """
+    def __init__(self, shards: int = 16) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [_Shard() for _ in range(shards)]
+        self._log: list[Emission] = []
+
+    def _shard(self, agent_id: str) -> _Shard:
+        return self._shards[hash(agent_id) % len(self._shards)]
+
+    def append(self, emission: Emission) -> None:
+        """Append a single emission."""
+        shard = self._shard(emission.agent_id)
+        with shard.lock:
+            agent = shard.by_agent.get(emission.agent_id)
+            if agent is None:
+                agent = shard.by_agent[emission.agent_id] = []
+            agent.append(emission)
+            self._log.append(emission)
+
+    def extend(self, emissions: Iterable[Emission]) -> None:
+        """Append emissions in order, taking each shard lock once."""
+        emissions = list(emissions)
+        with self._locked(emissions):
+            self._append_locked(emissions)
+
+    def extend_unique(
+        self,
+        emissions: Iterable[Emission],
+        key: Callable[[Emission], Hashable]
+    ) -> list[Emission]:
+        """Append emissions whose key is new for their agent.
+
+        The check and the append happen under the same shard locks, so
+        concurrent calls cannot both add the same emission. Returns the
+        emissions that were added, in order.
+        """
+        emissions = list(emissions)
+        added = []
+        with self._locked(emissions):
+            seen: dict[str, set] = {}
+            for emission in emissions:
+                agent_seen = seen.get(emission.agent_id)
+                if agent_seen is None:
+                    existing = self._shard(emission.agent_id).by_agent.get(
+                        emission.agent_id, ()
+                    )
+                    agent_seen = seen[emission.agent_id] = {
+                        key(e) for e in existing
+                    }
+                identity = key(emission)
+                if identity not in agent_seen:
+                    agent_seen.add(identity)
+                    added.append(emission)
+            self._append_locked(added)
+        return added
+
+    @contextmanager
+    def _locked(self, emissions: list[Emission]) -> Iterator[None]:
+        """Hold the locks of all shards involved, acquired in index order.
+
+        Holding them together makes a batch show up in the log and in its
+        agents' lists in the same position relative to concurrent appends.
+        """
+        indices = {hash(e.agent_id) % len(self._shards) for e in emissions}
+        with ExitStack() as stack:
+            for index in sorted(indices):
+                stack.enter_context(self._shards[index].lock)
+            yield
+
+    def _append_locked(self, emissions: list[Emission]) -> None:
+        """Append emissions; caller holds their shards' locks."""
+        by_agent: dict[str, list[Emission]] = {}
+        for emission in emissions:
+            by_agent.setdefault(emission.agent_id, []).append(emission)
+        for agent_id, batch in by_agent.items():
+            shard = self._shard(agent_id)
+            agent = shard.by_agent.get(agent_id)
+            if agent is None:
+                shard.by_agent[agent_id] = batch
+            else:
+                agent.extend(batch)
+        self._log.extend(emissions)
+
+    def snapshot(self, agent_id: str | None = None) -> list[Emission]:
+        """Return a consistent, insertion-ordered copy of the emissions."""
+        if agent_id is None:
+            log = self._log
+            return log[:len(log)]
+        shard = self._shard(agent_id)
+        with shard.lock:
+            agent = shard.by_agent.get(agent_id)
+            if agent is None:
+                return []
+            cut = len(agent)
+        return agent[:cut]
+
+    def __iter__(self) -> Iterator[Emission]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self._log)
@@ -2,6 +2,8 @@
 import pytest
 from fastapi.testclient import TestClient
 from pkg.api.routes import router
+from pkg.emitter import snapshot
+from pkg.models.emission import Emission, EmissionType
 
 client = TestClient(router)
 
@@ -77,3 +79,81 @@ async def test_publish():
     assert response.status_code == 200
     data = response.json()
     assert data["published"] is True
+
+def test_components():
+    """Test component catalog endpoints."""
+    client.post(
+        "/v1/emit",
+        json={
+            "emission_type": "tool_invoked",
+            "agent_id": "agent-7",
+            "component_name": "CatalogTool",
+        }
+    )
+    response = client.get("/v1/components", params={"component_type": "tool"})
+    assert response.status_code == 200
+    names = [c["name"] for c in response.json()["components"]]
+    assert "CatalogTool" in names
+    response = client.get("/v1/components/CatalogTool/agents")
+    assert response.status_code == 200
+    assert response.json()["agents"][0]["agent_id"] == "agent-7"
+    response = client.get("/v1/components/Missing/agents")
+    assert response.status_code == 404
+    response = client.get(
+        "/v1/components/CatalogTool/agents",
+        params={"component_type": "model"}
+    )
+    assert response.status_code == 404
+
+def test_export_import_snapshot(tmp_path):
+    """Test snapshot export and import endpoints."""
+    client.post(
+        "/v1/emit",
+        json={
+            "emission_type": "data_accessed",
+            "agent_id": "agent-9",
+            "component_name": "SnapshotDB",
+        }
+    )
+    filepath = str(tmp_path / "emissions.snap")
+    response = client.post(
+        "/v1/export",
+        params={"filepath": filepath, "format": "binary"}
+    )
+    assert response.status_code == 200
+    exported = response.json()["count"]
+    response = client.post("/v1/import", params={"filepath": filepath})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 0
+    assert data["total_collected"] == exported
+    response = client.get(
+        "/v1/components", params={"component_type": "data_source"}
+    )
+    usage = {
+        c["name"]: c["usage_count"] for c in response.json()["components"]
+    }
+    assert usage["SnapshotDB"] == 1
+
+def test_import_invalid_file(tmp_path):
+    """Test importing a file that is not a snapshot."""
+    filepath = tmp_path / "emissions.snap"
+    filepath.write_bytes(b"AIBOMSN1\x01")
+    response = client.post("/v1/import", params={"filepath": str(filepath)})
+    assert response.status_code == 400
+
+def test_import_bad_values(tmp_path):
+    """Test importing a snapshot holding an unknown emission type."""
+    filepath = str(tmp_path / "emissions.snap")
+    columns = snapshot._to_columns([
+        Emission(emission_type=EmissionType.MODEL_USED, agent_id="agent-1")
+    ])
+    columns["emission_type"][0] = "bogus"
+    snapshot._write_binary(columns, filepath)
+    response = client.post("/v1/import", params={"filepath": filepath})
+    assert response.status_code == 400
+
+def test_export_invalid_format():
+    """Test export with invalid format."""
+    response = client.post("/v1/export", params={"format": "xml"})
+    assert response.status_code == 400
@@ -0,0 +1,89 @@
+"""Test ComponentCatalog."""
+import threading
+import pytest
+from pkg.catalog.catalog import ComponentCatalog
+from pkg.emitter.publisher import EmissionPublisher
+from pkg.models.emission import Emission, EmissionType
+
+def _emission(agent_id, name, version="1.0", provider="OpenAI"):
+    return Emission(
+        emission_type=EmissionType.MODEL_USED,
+        agent_id=agent_id,
+        component_name=name,
+        component_version=version,
+        provider=provider,
+    )
+
+def test_record_and_list():
+    """Test recording components and listing them."""
+    catalog = ComponentCatalog()
+    catalog.record("model", _emission("agent-1", "GPT-4"))
+    catalog.record("model", _emission("agent-2", "GPT-4"))
+    catalog.record("model", _emission("agent-1", "GPT-4"))
+    catalog.record("tool", _emission("agent-1", "SearchTool"))
+    assert len(catalog) == 2
+    models = catalog.components("model")
+    assert len(models) == 1
+    assert models[0].agent_count == 2
+    assert models[0].usage_count == 3
+
+def test_agents_for():
+    """Test inverted index lookup across versions."""
+    catalog = ComponentCatalog()
+    catalog.record("model", _emission("agent-1", "GPT-4", version="1.0"))
+    catalog.record("model", _emission("agent-2", "GPT-4", version="2.0"))
+    catalog.record("model", _emission("agent-2", "GPT-4", version="2.0"))
+    result = catalog.agents_for("GPT-4")
+    assert [a.agent_id for a in result.agents] == ["agent-1", "agent-2"]
+    assert result.agents[1].usage_count == 2
+    result = catalog.agents_for("GPT-4", version="1.0")
+    assert [a.agent_id for a in result.agents] == ["agent-1"]
+    assert catalog.agents_for("Unknown") is None
+    assert catalog.agents_for("GPT-4", version="3.0") is None
+    assert catalog.agents_for("GPT-4", component_type="tool") is None
+
+def test_record_many_matches_record():
+    """Test batch recording gives the same counts as one at a time."""
+    emissions = [
+        _emission(f"agent-{i % 7}", "GPT-4", version=f"{i % 3}.0")
+        for i in range(100)
+    ]
+    one = ComponentCatalog(shards=4)
+    for emission in emissions:
+        one.record("model", emission)
+    many = ComponentCatalog(shards=4)
+    many.record_many(("model", e) for e in emissions)
+    assert sorted(one.components(), key=repr) == sorted(
+        many.components(), key=repr
+    )
+    assert one.agents_for("GPT-4") == many.agents_for("GPT-4")
+
+def test_invalid_shards():
+    """Test that a catalog needs at least one shard."""
+    with pytest.raises(ValueError):
+        ComponentCatalog(shards=0)
+
+def test_concurrent_record():
+    """Test that concurrent writers lose no counts across shards."""
+    catalog = ComponentCatalog(shards=4)
+
+    def write(t):
+        for i in range(1000):
+            catalog.record("model", _emission(f"agent-{t}-{i % 10}", "GPT-4"))
+
+    threads = [threading.Thread(target=write, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    [usage] = catalog.components()
+    assert usage.agent_count == 80
+    assert usage.usage_count == 8000
+
+def test_publisher_builds_catalog(sample_emission):
+    """Test that collected emissions are catalogued."""
+    pub = EmissionPublisher()
+    pub.collect(sample_emission)
+    pub.collect_batch([_emission("agent-2", "GPT-4")])
+    result = pub.catalog.agents_for("GPT-4", component_type="model")
+    assert [a.agent_id for a in result.agents] == ["agent-1", "agent-2"]
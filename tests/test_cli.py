@@ -0,0 +1,209 @@
+"""Test CLI commands."""
+import asyncio
+import subprocess
+import sys
+import httpx
+import pytest
+from click.testing import CliRunner
+from cli import main as cli_main
+
+# Cumulative import time of cli.main, in microseconds, as reported by
+# ``python -X importtime``. click itself accounts for most of it.
+IMPORT_BUDGET_US = 100_000
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Route CLI requests to an in-process handler."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("/health"):
+            return httpx.Response(200, json={"emissions_collected": 3})
+        return httpx.Response(200, json={"count": 2})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(cli_main._state, "client", client)
+    yield requests
+    client.close()
+
+def test_cold_import_is_lazy():
+    """Test that importing the CLI does not load httpx or rich."""
+    result = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            "import sys, cli.main; "
+            "print(any(m.split('.')[0] in ('httpx', 'rich') "
+            "for m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+    last = result.stderr.strip().splitlines()[-1]
+    cumulative = int(last.split("|")[1])
+    assert last.rstrip().endswith("cli.main")
+    assert cumulative < IMPORT_BUDGET_US
+
+def test_health(mock_client):
+    """Test health command."""
+    result = CliRunner().invoke(cli_main.cli, ["health"])
+    assert result.exit_code == 0
+    assert "Emissions collected: 3" in result.output
+
+def test_batch(mock_client):
+    """Test batch runs several commands over one client."""
+    commands = "health\n# comment\n\nlist-emissions --agent-id a1\nbogus\n"
+    result = CliRunner().invoke(cli_main.cli, ["batch"], input=commands)
+    assert result.exit_code == 1
+    assert "lines 5" in result.output
+    assert "Emissions collected: 3" in result.output
+    assert "Found 2 emissions" in result.output
+    assert "No such command" in result.output
+    assert len(mock_client) == 2
+    assert mock_client[1].url.params["agent_id"] == "a1"
+
+def test_batch_continues_after_bad_line(mock_client):
+    """Test an unparsable line is reported and later lines still run."""
+    commands = "list-emissions --agent-id 'a1\nhealth\n"
+    result = CliRunner().invoke(cli_main.cli, ["batch"], input=commands)
+    assert result.exit_code == 1
+    assert "line 1: No closing quotation" in result.output
+    assert "Emissions collected: 3" in result.output
+    assert len(mock_client) == 1
+
+def test_batch_succeeds_when_all_lines_pass(mock_client):
+    """Test batch exits 0 when every command succeeds."""
+    result = CliRunner().invoke(
+        cli_main.cli, ["batch"], input="health\nlist-emissions\n"
+    )
+    assert result.exit_code == 0
+
+def test_command_failure_exits_nonzero(monkeypatch):
+    """Test a failed request gives a non-zero exit status."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500))
+    )
+    monkeypatch.setitem(cli_main._state, "client", client)
+    result = CliRunner().invoke(cli_main.cli, ["batch"], input="health\n")
+    assert result.exit_code == 1
+    assert "Health check failed" in result.output
+    client.close()
+
+@pytest.fixture
+def mock_async_client(monkeypatch):
+    """Route fan-out requests to an in-process async handler."""
+    requests = []
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request):
+        requests.append(request)
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        agent_id = request.url.params.get("agent_id", "")
+        path = request.url.path
+        if agent_id == "bad" or path.endswith("/bad"):
+            return httpx.Response(500)
+        if agent_id == "odd" or path.endswith("/odd"):
+            return httpx.Response(200, json={"unexpected": True})
+        if path.endswith("/observe"):
+            return httpx.Response(
+                200, json={"emissions_generated": 15, "total_collected": 15}
+            )
+        if "/summary/" in path:
+            return httpx.Response(200, json={
+                "total_emissions": 15,
+                "unique_models": ["GPT-4"],
+                "unique_tools": ["SearchTool"],
+                "unique_data_sources": [],
+            })
+        return httpx.Response(200, json={"count": 3})
+
+    def new_client(concurrency):
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+
+    monkeypatch.setattr(cli_main, "_new_async_client", new_client)
+    return requests, in_flight
+
+def test_observe_many_agents(mock_async_client, tmp_path):
+    """Test observe fans out over repeated ids and an agents file."""
+    requests, _ = mock_async_client
+    agents_file = tmp_path / "agents.txt"
+    agents_file.write_text("agent-2\n# skipped\nagent-3\nagent-1\n")
+    result = CliRunner().invoke(
+        cli_main.cli,
+        [
+            "observe", "--agent-id", "agent-1", "--agent-id", "bad",
+            "--agents-file", str(agents_file), "--concurrency", "2",
+        ],
+    )
+    assert result.exit_code == 1
+    assert len(requests) == 4
+    assert "3 succeeded, 1 failed" in result.output
+
+def test_summary_many_agents(mock_async_client):
+    """Test summary fans out and aggregates into one table."""
+    requests, _ = mock_async_client
+    result = CliRunner().invoke(
+        cli_main.cli, ["summary", "--agent-id", "a1", "--agent-id", "a2"]
+    )
+    assert result.exit_code == 0
+    assert {r.url.path for r in requests} == {
+        "/v1/summary/a1", "/v1/summary/a2"
+    }
+    assert "Emissions for 2 agents" in result.output
+    assert "2 succeeded, 0 failed" in result.output
+
+def test_unexpected_body_fails_only_that_agent(mock_async_client):
+    """Test a 2xx response with a bad body is reported per agent."""
+    result = CliRunner().invoke(
+        cli_main.cli, ["summary", "--agent-id", "a1", "--agent-id", "odd"]
+    )
+    assert result.exit_code == 1
+    assert "1 succeeded, 1 failed" in result.output
+    assert "total_emissions" in result.output
+
+def test_concurrency_limits_requests(mock_async_client):
+    """Test --concurrency bounds the requests in flight."""
+    requests, in_flight = mock_async_client
+    agents = [arg for i in range(10) for arg in ("--agent-id", f"a{i}")]
+    result = CliRunner().invoke(
+        cli_main.cli, ["observe", *agents, "--concurrency", "3"]
+    )
+    assert result.exit_code == 0
+    assert len(requests) == 10
+    assert in_flight["max"] == 3
+
+def test_publish_many_agents(mock_async_client):
+    """Test publish fans out per agent."""
+    requests, _ = mock_async_client
+    result = CliRunner().invoke(
+        cli_main.cli,
+        ["publish", "--aibom-id", "aibom-1", "--agent-id", "a", "--agent-id", "b"],
+    )
+    assert result.exit_code == 0
+    assert {r.url.params["agent_id"] for r in requests} == {"a", "b"}
+    assert "2 succeeded, 0 failed" in result.output
+
+def test_publish_empty_agents_file(mock_client, tmp_path):
+    """Test publish with an agents file listing nobody publishes nothing."""
+    agents_file = tmp_path / "agents.txt"
+    agents_file.write_text("# nobody yet\n\n")
+    result = CliRunner().invoke(
+        cli_main.cli,
+        ["publish", "--aibom-id", "aibom-1", "--agents-file", str(agents_file)],
+    )
+    assert result.exit_code == 2
+    assert "no agent IDs" in result.output
+    assert mock_client == []
+
+def test_observe_requires_agent():
+    """Test observe without any agent is a usage error."""
+    result = CliRunner().invoke(cli_main.cli, ["observe"])
+    assert result.exit_code == 2
@@ -39,7 +39,7 @@ async def test_extract_emissions():
 def test_get_summary():
     """Test getting emission summary."""
     observer = RuntimeObserver()
-    observer._emissions = [
+    observer._emissions.extend([
         type('E', (), {
             'agent_id': 'agent-1',
             'emission_type': EmissionType.MODEL_USED,
@@ -50,7 +50,13 @@ def test_get_summary():
             'emission_type': EmissionType.TOOL_INVOKED,
             'component_name': 'SearchTool'
         })(),
-    ]
+        type('E', (), {
+            'agent_id': 'agent-2',
+            'emission_type': EmissionType.MODEL_USED,
+            'component_name': 'Claude'
+        })(),
+    ])
     summary = observer.get_summary("agent-1")
     assert summary.agent_id == "agent-1"
     assert summary.total_emissions == 2
+    assert summary.unique_models == ["GPT-4"]
@@ -9,6 +9,22 @@ def test_publisher_initialization():
     assert pub.aibom_api_url == "http://localhost:8600/v1"
     assert len(pub._emissions) == 0
 
+def test_publisher_shards():
+    """Test the shard count is configurable."""
+    pub = EmissionPublisher(shards=1)
+    for agent_id in ("agent-1", "agent-2", "agent-1"):
+        pub.collect(
+            Emission(
+                emission_type=EmissionType.MODEL_USED,
+                agent_id=agent_id,
+                component_name="m1"
+            )
+        )
+    assert len(pub.get_emissions(agent_id="agent-1")) == 2
+    assert [e.agent_id for e in pub.get_emissions()] == [
+        "agent-1", "agent-2", "agent-1"
+    ]
+
 def test_collect_emission(sample_emission):
     """Test collecting an emission."""
     pub = EmissionPublisher()
@@ -0,0 +1,175 @@
+"""Test columnar snapshot export/import."""
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+import pytest
+from pkg.emitter import snapshot
+from pkg.emitter.publisher import EmissionPublisher
+from pkg.emitter.snapshot import read_snapshot, write_snapshot
+from pkg.models.emission import Emission, EmissionType
+
+def _emissions():
+    return [
+        Emission(
+            id=f"em-{i}",
+            emission_type=EmissionType.TOOL_INVOKED,
+            agent_id=f"agent-{i % 2}",
+            component_name="SearchTool",
+            component_version="1.0",
+            provider="Internal",
+            metadata={"episode_id": f"ep-{i}"},
+        )
+        for i in range(4)
+    ]
+
+@pytest.fixture(params=["binary", "arrow"])
+def engine(request):
+    """Snapshot engines to test."""
+    if request.param == "arrow":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+def test_roundtrip(tmp_path, engine):
+    """Test emissions survive a snapshot round trip unchanged."""
+    path = str(tmp_path / "emissions.snap")
+    emissions = _emissions()
+    write_snapshot(emissions, path, engine=engine)
+    loaded = read_snapshot(path)
+    assert loaded == emissions
+    assert [e.model_dump(exclude_unset=True) for e in loaded] == [
+        e.model_dump(exclude_unset=True) for e in emissions
+    ]
+
+def test_roundtrip_preserves_timezones_and_fields_set(tmp_path, engine):
+    """Test naive and offset timestamps and unset fields round trip."""
+    path = str(tmp_path / "emissions.snap")
+    emissions = [
+        Emission(
+            emission_type=EmissionType.MODEL_USED,
+            timestamp=datetime(2024, 1, 15, 10, 0, 0, 123456),
+        ),
+        Emission(
+            emission_type=EmissionType.MODEL_USED,
+            timestamp=datetime(
+                2024, 1, 15, 10, 0, tzinfo=timezone(timedelta(hours=2))
+            ),
+        ),
+    ]
+    write_snapshot(emissions, path, engine=engine)
+    loaded = read_snapshot(path)
+    assert loaded == emissions
+    assert loaded[0].timestamp.tzinfo is None
+    assert loaded[1].timestamp.utcoffset() == timedelta(hours=2)
+    assert loaded[0].model_fields_set == {"emission_type", "timestamp"}
+
+def test_rows_do_not_share_metadata(tmp_path, engine):
+    """Test nested metadata is not shared between loaded rows."""
+    path = str(tmp_path / "emissions.snap")
+    emissions = [
+        Emission(emission_type=EmissionType.MODEL_USED, metadata={"a": {"b": 1}})
+        for _ in range(2)
+    ]
+    write_snapshot(emissions, path, engine=engine)
+    loaded = read_snapshot(path)
+    loaded[0].metadata["a"]["b"] = 2
+    assert loaded[1].metadata == {"a": {"b": 1}}
+
+def test_read_rejects_truncated_file(tmp_path, engine):
+    """Test reading a truncated snapshot."""
+    path = tmp_path / "emissions.snap"
+    write_snapshot(_emissions(), str(path), engine=engine)
+    data = path.read_bytes()
+    for size in (len(data) - 1, len(data) // 2, 10):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="Not an emission snapshot"):
+            read_snapshot(str(path))
+
+@pytest.mark.parametrize("column, value", [
+    ("emission_type", "bogus"),
+    ("timestamp", 2 ** 62),
+    ("utc_offset", "not-a-number"),
+])
+def test_read_rejects_bad_values(tmp_path, engine, column, value):
+    """Test well-formed snapshots holding invalid values are rejected."""
+    path = str(tmp_path / "emissions.snap")
+    columns = snapshot._to_columns(_emissions())
+    columns[column][1] = value
+    if engine == "arrow":
+        snapshot._write_arrow(snapshot._pyarrow(), columns, path)
+    else:
+        snapshot._write_binary(columns, path)
+    with pytest.raises(ValueError, match="Not an emission snapshot"):
+        read_snapshot(path)
+
+def test_read_rejects_foreign_arrow_file(tmp_path):
+    """Test reading an Arrow file without the emission schema."""
+    pa = pytest.importorskip("pyarrow")
+    feather = pytest.importorskip("pyarrow.feather")
+    path = str(tmp_path / "other.arrow")
+    feather.write_feather(
+        pa.table({"id": ["a"], "value": [1]}), path, compression="uncompressed"
+    )
+    with pytest.raises(ValueError, match="Not an emission snapshot"):
+        read_snapshot(path)
+
+def test_arrow_engine_requires_pyarrow(tmp_path, monkeypatch):
+    """Test the arrow engine fails clearly without pyarrow."""
+    monkeypatch.setattr(snapshot, "_pyarrow", lambda: None)
+    assert snapshot.default_engine() == "binary"
+    with pytest.raises(RuntimeError):
+        write_snapshot([], str(tmp_path / "e.arrow"), engine="arrow")
+
+def test_import_does_not_load_pyarrow():
+    """Test the server import path does not pull in pyarrow."""
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys, pkg.api.routes; print('pyarrow' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+def test_read_rejects_unknown_file(tmp_path):
+    """Test reading a file that is not a snapshot."""
+    path = tmp_path / "emissions.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        read_snapshot(str(path))
+
+def test_publisher_import_snapshot(tmp_path):
+    """Test importing a snapshot into a publisher."""
+    path = str(tmp_path / "emissions.snap")
+    source = EmissionPublisher()
+    source.collect_batch(_emissions())
+    source.export_snapshot(path, engine="binary")
+    target = EmissionPublisher()
+    assert target.import_snapshot(path) == 4
+    assert target.import_snapshot(path) == 0
+    assert len(target.get_emissions()) == 4
+    assert len(target.get_emissions(agent_id="agent-1")) == 2
+    assert len(target.catalog.agents_for("SearchTool").agents) == 2
+
+def test_concurrent_imports_add_once(tmp_path):
+    """Test concurrent imports of one snapshot do not duplicate it."""
+    path = str(tmp_path / "emissions.snap")
+    source = EmissionPublisher()
+    source.collect_batch(_emissions())
+    source.export_snapshot(path, engine="binary")
+    target = EmissionPublisher()
+    counts = []
+
+    def load():
+        counts.append(target.import_snapshot(path))
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(counts) == 4
+    assert len(target.get_emissions()) == 4
+    assert sum(c.usage_count for c in target.catalog.components()) == 4
@@ -0,0 +1,113 @@
+"""Test ShardedEmissionStore."""
+import threading
+import pytest
+from pkg.store.sharded import ShardedEmissionStore
+from pkg.models.emission import Emission, EmissionType
+
+def _emission(agent_id, index):
+    return Emission(
+        id=f"{agent_id}-{index}",
+        emission_type=EmissionType.MODEL_USED,
+        agent_id=agent_id,
+        component_name="GPT-4",
+    )
+
+def test_snapshot_preserves_insertion_order():
+    """Test snapshots merge shards back into insertion order."""
+    store = ShardedEmissionStore(shards=4)
+    emissions = [_emission(f"agent-{i % 7}", i) for i in range(50)]
+    store.extend(emissions[:20])
+    for emission in emissions[20:]:
+        store.append(emission)
+    assert len(store) == 50
+    assert [e.id for e in store.snapshot()] == [e.id for e in emissions]
+    assert [e.id for e in store.snapshot("agent-3")] == [
+        e.id for e in emissions if e.agent_id == "agent-3"
+    ]
+    assert store.snapshot("missing") == []
+
+def test_extend_unique_skips_known_keys():
+    """Test extend_unique adds only emissions new for their agent."""
+    store = ShardedEmissionStore(shards=4)
+    store.extend([_emission("agent-1", 0)])
+    batch = [
+        _emission("agent-1", 0),
+        _emission("agent-1", 1),
+        _emission("agent-1", 1),
+        _emission("agent-2", 0),
+    ]
+    added = store.extend_unique(batch, lambda e: e.id)
+    assert [e.id for e in added] == ["agent-1-1", "agent-2-0"]
+    assert [e.id for e in store.snapshot()] == [
+        "agent-1-0", "agent-1-1", "agent-2-0"
+    ]
+
+def test_concurrent_extend_unique():
+    """Test concurrent extend_unique calls add each emission once."""
+    store = ShardedEmissionStore(shards=4)
+    batch = [_emission(f"agent-{i % 7}", i) for i in range(500)]
+    counts = []
+
+    def add():
+        counts.append(len(store.extend_unique(batch, lambda e: e.id)))
+
+    threads = [threading.Thread(target=add) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(counts) == 500
+    assert sorted(e.id for e in store.snapshot()) == sorted(
+        e.id for e in batch
+    )
+
+def test_snapshot_is_isolated_from_later_writes():
+    """Test a snapshot does not change when writers keep appending."""
+    store = ShardedEmissionStore()
+    store.append(_emission("agent-1", 0))
+    snapshot = store.snapshot()
+    store.append(_emission("agent-1", 1))
+    assert len(snapshot) == 1
+    assert len(store) == 2
+
+def test_invalid_shard_count():
+    """Test shard count validation."""
+    with pytest.raises(ValueError):
+        ShardedEmissionStore(shards=0)
+
+def test_concurrent_writers_and_readers():
+    """Test readers see consistent prefixes while writers append."""
+    store = ShardedEmissionStore(shards=4)
+    writers, per_writer = 8, 500
+    done = threading.Event()
+    errors = []
+
+    def write(worker):
+        agent_id = f"agent-{worker}"
+        for i in range(per_writer):
+            store.append(_emission(agent_id, i))
+
+    def read():
+        while not done.is_set():
+            seen = {}
+            for emission in store.snapshot():
+                agent_id, index = emission.id.rsplit("-", 1)
+                if int(index) != seen.get(agent_id, 0):
+                    errors.append(emission.id)
+                seen[agent_id] = int(index) + 1
+            for i, emission in enumerate(store.snapshot("agent-0")):
+                if emission.id != f"agent-0-{i}":
+                    errors.append(emission.id)
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+    reader = threading.Thread(target=read)
+    reader.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    reader.join()
+    assert errors == []
+    assert len(store) == writers * per_writer
+    assert len(store.snapshot("agent-0")) == per_writer